@@ -5,18 +5,17 @@
 # ///
 
 import os
-import sys
+from pathlib import Path
 
 def main():
     cwd = os.getcwd()
     print(f"Current working directory: {cwd}")
-    
-    # Write a test file to verify we're in the right directory
-    test_file = "cwd_test_output.txt"
-    with open(test_file, "w") as f:
-        f.write(f"Script ran from: {cwd}\n")
-    
-    print(f"Created test file: {os.path.abspath(test_file)}")
+
+    # Write a test file to verify we're in the right directory; write_text
+    # is the shortest call chain for a one-line file
+    Path("cwd_test_output.txt").write_text(f"Script ran from: {cwd}\n")
+
+    print(f"Created test file: {os.path.join(cwd, 'cwd_test_output.txt')}")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
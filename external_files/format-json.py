@@ -29,13 +29,18 @@ def main():
         with open(file_path) as f:
             data = json.load(f)
         
+        # Serialize once and write in a single call: json.dump issues a
+        # write() per encoder chunk, which is much slower for big files.
         with open(file_path, 'w') as f:
-            json.dump(data, f, indent=2, sort_keys=True)
-        
+            f.write(json.dumps(data, indent=2, sort_keys=True))
+
         print(f"✅ Formatted {file_path}")
     except json.JSONDecodeError as e:
         print(f"❌ Invalid JSON: {e}")
         sys.exit(1)
+    except OSError as e:
+        print(f"❌ Write failed: {e}")
+        sys.exit(1)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
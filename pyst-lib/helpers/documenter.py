@@ -9,70 +9,103 @@ using AI models through the DSPy framework.
 # requires-python = ">=3.11"
 # dependencies = [
 #     "dspy",
+#     "orjson",
 # ]
 # ///
 
+import ast
+import functools
 import json
 import sys
 import os
 from typing import Optional, Dict, Any
-import dspy
 
+try:
+    import orjson  # declared in the PEP 723 deps; fallback covers bare runs
+except ImportError:
+    orjson = None
 
-class DocumentationSignature(dspy.Signature):
-    """Generate a concise, informative description for a Python script."""
-    
-    script_content: str = dspy.InputField(desc="The complete Python script content")
-    entry_point: str = dspy.InputField(desc="Entry point type (PEP723, Framework, MainFunction, etc.)")
-    functions: str = dspy.InputField(desc="JSON list of function names and docstrings")
-    dependencies: str = dspy.InputField(desc="JSON list of dependencies")
-    current_description: str = dspy.InputField(desc="Current description if any, or empty string")
-    max_length: int = dspy.InputField(desc="Maximum character length for description")
-    
-    description: str = dspy.OutputField(
-        desc="A concise, informative description that explains what the script does (not how). "
-             "Should be suitable for command discovery and fit terminal display. "
-             "Focus on the script's purpose and main functionality."
-    )
+# Reused for the stdlib fallback so each call skips encoder construction
+_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'))
 
 
-class ScriptDocumenter(dspy.Module):
-    """DSPy module for generating script documentation."""
-    
-    def __init__(self):
-        super().__init__()
-        self.generate_description = dspy.ChainOfThought(DocumentationSignature)
-    
-    def forward(self, script_content: str, entry_point: str, functions: str, 
-                dependencies: str, current_description: str = "", max_length: int = 80):
-        """Generate a description for the given script."""
-        
-        result = self.generate_description(
-            script_content=script_content,
-            entry_point=entry_point,
-            functions=functions,
-            dependencies=dependencies,
-            current_description=current_description,
-            max_length=max_length
+def write_result(result: Dict[str, Any]) -> None:
+    """Write a result dict to stdout as a single JSON line."""
+    if orjson is not None:
+        sys.stdout.buffer.write(orjson.dumps(result) + b"\n")
+        sys.stdout.buffer.flush()
+    else:
+        print(_ENCODER.encode(result))
+
+
+@functools.cache
+def _dspy_components():
+    """Import dspy on first use and build the signature/module classes.
+
+    dspy drags in heavyweight dependencies (litellm, tokenizers) costing
+    hundreds of milliseconds, so the import is deferred until a description
+    is actually generated; usage/JSON-error paths stay fast.
+    """
+    import dspy
+
+    class DocumentationSignature(dspy.Signature):
+        """Generate a concise, informative description for a Python script."""
+
+        # Short, stable fields first and the long, per-script content last so
+        # provider-side prompt caching can reuse the common prefix across calls
+        max_length: int = dspy.InputField(desc="Maximum character length for description")
+        entry_point: str = dspy.InputField(desc="Entry point type (PEP723, Framework, MainFunction, etc.)")
+        dependencies: str = dspy.InputField(desc="JSON list of dependencies")
+        functions: str = dspy.InputField(desc="JSON list of function names and docstrings")
+        current_description: str = dspy.InputField(desc="Current description if any, or empty string")
+        script_content: str = dspy.InputField(desc="The complete Python script content")
+
+        description: str = dspy.OutputField(
+            desc="A concise, informative description that explains what the script does (not how). "
+                 "Should be suitable for command discovery and fit terminal display. "
+                 "Focus on the script's purpose and main functionality."
         )
-        
-        # Ensure the description fits within the length limit
-        description = result.description.strip()
-        if len(description) > max_length:
-            # Try to truncate at word boundary
-            words = description[:max_length].split()
-            if len(words) > 1:
-                words.pop()  # Remove last potentially truncated word
-                description = " ".join(words) + "..."
-            else:
-                description = description[:max_length-3] + "..."
-        
-        return description
+
+    class ScriptDocumenter(dspy.Module):
+        """DSPy module for generating script documentation."""
+
+        def __init__(self):
+            super().__init__()
+            self.generate_description = dspy.ChainOfThought(DocumentationSignature)
+
+        def forward(self, script_content: str, entry_point: str, functions: str,
+                    dependencies: str, current_description: str = "", max_length: int = 80):
+            """Generate a description for the given script."""
+
+            result = self.generate_description(
+                max_length=max_length,
+                entry_point=entry_point,
+                dependencies=dependencies,
+                functions=functions,
+                current_description=current_description,
+                script_content=script_content
+            )
+
+            # Ensure the description fits within the length limit
+            description = result.description.strip()
+            if len(description) > max_length:
+                # Try to truncate at word boundary
+                cut = description.rfind(' ', 0, max_length - 3)
+                if cut > 0:
+                    description = description[:cut] + "..."
+                else:
+                    description = description[:max_length-3] + "..."
+
+            return description
+
+    return dspy, ScriptDocumenter
 
 
 def configure_dspy(config: Dict[str, Any]) -> None:
     """Configure DSPy with the provided settings."""
-    
+
+    dspy = _dspy_components()[0]
+
     # Extract configuration
     model = config.get("model", "google/gemini-2.5-flash")
     api_key_env = config.get("api_key_env", "OPENROUTER_API_KEY")
@@ -107,6 +140,46 @@ def configure_dspy(config: Dict[str, Any]) -> None:
     lm = dspy.LM(model, **lm_kwargs)
     dspy.configure(lm=lm)
 
+    # Persist responses on disk: an unchanged script produces an identical
+    # prompt, so re-documenting it skips the LLM round-trip entirely
+    try:
+        dspy.configure_cache(
+            enable_disk_cache=True,
+            disk_cache_dir=os.path.expanduser("~/.cache/pyst/dspy"),
+        )
+    except Exception:
+        # Older dspy versions lack configure_cache; they cache in-memory only
+        pass
+
+
+def _minify_for_llm(src: str) -> str:
+    """Strip comments, blank lines and non-module docstrings from a script.
+
+    The signature only asks for a short description, so most source tokens
+    are waste; round-tripping through the AST drops comments and whitespace,
+    and docstrings below module scope are removed as well. Falls back to the
+    original source if it doesn't parse.
+    """
+    try:
+        tree = ast.parse(src)
+    except SyntaxError:
+        return src
+
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            body = node.body
+            if (body and isinstance(body[0], ast.Expr)
+                    and isinstance(body[0].value, ast.Constant)
+                    and isinstance(body[0].value.value, str)):
+                del body[0]
+                if not body:
+                    body.append(ast.Pass())
+
+    try:
+        return ast.unparse(tree)
+    except Exception:
+        return src
+
 
 def generate_documentation(script_data: Dict[str, Any], config: Dict[str, Any]) -> Dict[str, Any]:
     """Generate documentation for a script using DSPy."""
@@ -114,12 +187,13 @@ def generate_documentation(script_data: Dict[str, Any], config: Dict[str, Any])
     try:
         # Configure DSPy
         configure_dspy(config)
-        
-        # Create documenter
-        documenter = ScriptDocumenter()
-        
-        # Extract data
-        script_content = script_data.get("script_content", "")
+
+        # Create documenter (imports dspy on first use)
+        documenter = _dspy_components()[1]()
+
+        # Extract data; compress the script so the prompt carries only the
+        # tokens that inform the description
+        script_content = _minify_for_llm(script_data.get("script_content", ""))
         entry_point = script_data.get("entry_point", "Unknown")
         functions = json.dumps(script_data.get("functions", []))
         dependencies = json.dumps(script_data.get("dependencies", []))
@@ -152,15 +226,22 @@ def generate_documentation(script_data: Dict[str, Any], config: Dict[str, Any])
 
 def main():
     """Main entry point for the documenter script."""
-    
-    if len(sys.argv) != 2:
-        print("Usage: documenter.py <config_and_data_json>")
+
+    # Prefer stdin for the input JSON: argv is subject to ARG_MAX and shell
+    # quoting, which large script_content payloads can hit. A single argv
+    # blob is still accepted for older callers.
+    if len(sys.argv) == 1 or (len(sys.argv) == 2 and sys.argv[1] == "-"):
+        raw = sys.stdin.buffer.read()
+    elif len(sys.argv) == 2:
+        raw = sys.argv[1]
+    else:
+        print("Usage: documenter.py [config_and_data_json | -] (or pipe JSON to stdin)")
         sys.exit(1)
-    
+
     try:
         # Parse input JSON
-        input_data = json.loads(sys.argv[1])
-        
+        input_data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+
         # Extract configuration and script data
         config = input_data.get("config", {})
         script_data = input_data.get("script_data", {})
@@ -169,15 +250,15 @@ def main():
         result = generate_documentation(script_data, config)
         
         # Output result as JSON
-        print(json.dumps(result))
+        write_result(result)
         
-    except json.JSONDecodeError as e:
+    except ValueError as e:  # covers json and orjson decode errors
         result = {
             "success": False,
             "description": None,
             "error": f"Invalid JSON input: {e}"
         }
-        print(json.dumps(result))
+        write_result(result)
         sys.exit(1)
     
     except Exception as e:
@@ -186,7 +267,7 @@ def main():
             "description": None,
             "error": f"Unexpected error: {e}"
         }
-        print(json.dumps(result))
+        write_result(result)
         sys.exit(1)
 
 
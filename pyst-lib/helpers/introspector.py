@@ -16,27 +16,170 @@ import os
 import re
 import importlib.util
 import hashlib
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Union
 import traceback
 
+try:
+    import orjson  # Rust-native JSON encoder, much faster for large payloads
+except ImportError:
+    orjson = None
+
+try:
+    import tomllib  # Python 3.11+
+except ImportError:
+    import tomli as tomllib  # fallback
+
 
 SCHEMA_VERSION = "1.0.0"
 
+# Sentinel for caches whose computed value may legitimately be None
+_UNSET = object()
+
+# Splits a dependency spec like "click>=8.0.0" into name and version operator
+_VERSION_OP = re.compile(r'(==|>=|<=|~=|!=|>|<)')
+
+# PEP 723 block markers, anchored to whole lines so text that merely mentions
+# a marker (e.g. in a docstring) can't open or close a block
+_PEP723_OPEN = re.compile(r'^[ \t]*# /// script[ \t]*$', re.MULTILINE)
+_PEP723_CLOSE = re.compile(r'^[ \t]*# ///[ \t]*$', re.MULTILINE)
+
+# Interned constants for tag strings repeated across every result entry, so
+# large results share one str object per tag instead of allocating hundreds
+_SRC_PEP723 = sys.intern("Pep723")
+_SRC_IMPORT = sys.intern("Import")
+_ENTRY_MAIN = sys.intern("Main")
+_ENTRY_CLI_COMMAND = sys.intern("CliCommand")
+
+# Decorator names (sans call parentheses) that mark a CLI command entry point
+_CLI_DECORATORS = frozenset({
+    "click.command",
+    "click.group",
+    "command",
+    "app.command",
+    "typer.command",
+})
+
+
+class _Collector:
+    """Single-pass AST walker gathering entry points, functions, classes and imports."""
+
+    def __init__(self, introspector: "SafeIntrospector"):
+        self.introspector = introspector
+        self.entry_points = []
+        self.functions = []
+        self.classes = []
+        self.imports = []
+        self._class_depth = 0
+        # Exact-type dispatch: one dict lookup per node instead of the
+        # visit_<ClassName> attribute lookup NodeVisitor does
+        self._dispatch = {
+            ast.FunctionDef: self._handle_function,
+            ast.AsyncFunctionDef: self._handle_function,
+            ast.ClassDef: self._handle_class,
+            ast.Import: self._handle_import,
+            ast.ImportFrom: self._handle_import_from,
+        }
+
+    def visit(self, tree):
+        """Walk the tree once, dispatching on node type."""
+        self._walk(tree)
+
+    def _walk(self, node):
+        dispatch = self._dispatch
+        for child in ast.iter_child_nodes(node):
+            handler = dispatch.get(type(child))
+            if handler is not None:
+                handler(child)
+            else:
+                self._walk(child)
+
+    def _handle_function(self, node):
+        self.functions.append(self.introspector._function_info(node))
+
+        # Only module-level functions qualify as entry points
+        if self._class_depth == 0:
+            if node.name == "main":
+                self.entry_points.append({
+                    "name": "main",
+                    "callable": "main",
+                    "module": None,
+                    "entry_type": _ENTRY_MAIN
+                })
+            elif self.introspector._has_cli_decorator(node.decorator_list):
+                self.entry_points.append({
+                    "name": node.name,
+                    "callable": node.name,
+                    "module": None,
+                    "entry_type": _ENTRY_CLI_COMMAND
+                })
+
+        self._walk(node)
+
+    def _handle_class(self, node):
+        class_info = {
+            "name": node.name,
+            "line_number": node.lineno,
+            "docstring": ast.get_docstring(node),
+            "methods": [
+                self.introspector._function_info(item)
+                for item in node.body
+                if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef))
+            ],
+            "base_classes": [self.introspector._node_to_string(base) for base in node.bases]
+        }
+        self.classes.append(class_info)
+
+        self._class_depth += 1
+        self._walk(node)
+        self._class_depth -= 1
+
+    def _handle_import(self, node):
+        for alias in node.names:
+            self.imports.append({
+                "module": alias.name,
+                "names": [],
+                "alias": alias.asname,
+                "is_from_import": False,
+                "line_number": node.lineno
+            })
+
+    def _handle_import_from(self, node):
+        self.imports.append({
+            "module": node.module or "",
+            "names": [alias.name for alias in node.names],
+            "alias": None,
+            "is_from_import": True,
+            "line_number": node.lineno
+        })
+
 
 class SafeIntrospector:
     """Safe static analysis using AST parsing."""
-    
-    def __init__(self, script_path: Path):
+
+    def __init__(self, script_path: Path, raw: Optional[bytes] = None):
         self.script_path = script_path
-        self.content = script_path.read_text(encoding='utf-8')
+        self._raw = raw if raw is not None else script_path.read_bytes()
+        self._content = None
         self.tree = None
         self.errors = []
-        
+        self._collector = None
+        self._pep723_metadata = _UNSET
+
+    @property
+    def content(self) -> str:
+        """Script source, decoded on first use (only the PEP 723 parser needs it)."""
+        if self._content is None:
+            self._content = self._raw.decode('utf-8')
+        return self._content
+
     def introspect(self) -> Dict[str, Any]:
         """Perform static introspection."""
         try:
-            self.tree = ast.parse(self.content, str(self.script_path))
+            # ast.parse accepts bytes and handles encoding declarations itself,
+            # so no Python-level decode is needed before parsing
+            self.tree = ast.parse(self._raw, str(self.script_path))
         except SyntaxError as e:
             self.errors.append({
                 "error_type": "SyntaxError",
@@ -104,55 +247,47 @@ class SafeIntrospector:
         return None
     
     def _extract_pep723_metadata(self) -> Optional[Dict[str, Any]]:
-        """Extract PEP 723 script metadata block."""
-        lines = self.content.split('\n')
-        in_script_block = False
+        """Extract PEP 723 script metadata block (parsed once, then cached)."""
+        if self._pep723_metadata is _UNSET:
+            self._pep723_metadata = self._parse_pep723_metadata()
+        return self._pep723_metadata
+
+    def _parse_pep723_metadata(self) -> Optional[Dict[str, Any]]:
+        """Parse the PEP 723 script metadata block."""
+        # Locate the block by its markers so we only split the header lines,
+        # not the entire file.
+        opener = _PEP723_OPEN.search(self.content)
+        if opener is None:
+            return None
+        closer = _PEP723_CLOSE.search(self.content, opener.end())
+        block = self.content[opener.end():closer.start() if closer else len(self.content)]
+
         metadata_lines = []
-        
-        for line in lines:
+        for line in block.split('\n'):
             stripped = line.strip()
-            if stripped == "# /// script":
-                in_script_block = True
-                continue
-            elif stripped == "# ///" and in_script_block:
-                break
-            elif in_script_block:
-                if stripped.startswith('#'):
-                    metadata_lines.append(stripped[1:].strip())
-        
-        if metadata_lines:
-            try:
-                # Parse TOML-like metadata
-                try:
-                    import tomllib  # Python 3.11+
-                except ImportError:
-                    import tomli as tomllib  # fallback
-                toml_content = '\n'.join(metadata_lines)
-                metadata = tomllib.loads(toml_content)
-                return {
-                    "dependencies": metadata.get("dependencies", []),
-                    "requires_python": metadata.get("requires-python"),
-                    "tool_config": metadata.get("tool", {})
-                }
-            except Exception:
-                # Fallback to simple parsing
-                dependencies = []
-                for line in metadata_lines:
-                    if line.startswith('dependencies = '):
-                        # Simple list parsing
-                        deps_str = line.replace('dependencies = ', '').strip()
-                        if deps_str.startswith('[') and deps_str.endswith(']'):
-                            deps_str = deps_str[1:-1]
-                            dependencies = [dep.strip(' "\'') for dep in deps_str.split(',') if dep.strip()]
-                
-                if dependencies:
-                    return {
-                        "dependencies": dependencies,
-                        "requires_python": None,
-                        "tool_config": {}
-                    }
-        
-        return None
+            if stripped.startswith('#'):
+                metadata_lines.append(stripped[1:].strip())
+
+        if not metadata_lines:
+            return None
+
+        # Valid PEP 723 blocks are plain TOML; if parsing fails, report the
+        # problem rather than guessing with a hand-rolled fallback
+        try:
+            metadata = tomllib.loads('\n'.join(metadata_lines))
+        except Exception as e:
+            self.errors.append({
+                "error_type": "SyntaxError",
+                "message": f"Invalid PEP 723 metadata: {e}",
+                "line_number": None
+            })
+            return None
+
+        return {
+            "dependencies": metadata.get("dependencies", []),
+            "requires_python": metadata.get("requires-python"),
+            "tool_config": metadata.get("tool", {})
+        }
     
     def _extract_dependencies(self) -> List[Dict[str, Any]]:
         """Extract dependencies from various sources."""
@@ -162,10 +297,11 @@ class SafeIntrospector:
         pep723 = self._extract_pep723_metadata()
         if pep723:
             for dep in pep723["dependencies"]:
+                parts = _VERSION_OP.split(dep, maxsplit=1)
                 dependencies.append({
-                    "name": dep.split("==")[0].split(">=")[0].split("<=")[0].split(">")[0].split("<")[0],
-                    "version_spec": dep.replace(dep.split("==")[0].split(">=")[0].split("<=")[0].split(">")[0].split("<")[0], "") or None,
-                    "source": "Pep723"
+                    "name": parts[0].strip(),
+                    "version_spec": ''.join(parts[1:]).strip() or None,
+                    "source": _SRC_PEP723
                 })
         
         # From imports (approximation)
@@ -175,86 +311,48 @@ class SafeIntrospector:
                 dependencies.append({
                     "name": import_info["module"],
                     "version_spec": None,
-                    "source": "Import"
+                    "source": _SRC_IMPORT
                 })
         
         return dependencies
     
-    def _has_click_decorator(self, decorator_list) -> bool:
-        """Check if a function has a Click decorator."""
+    def _has_cli_decorator(self, decorator_list) -> bool:
+        """Check if a function has a recognized CLI command decorator."""
         for decorator in decorator_list:
-            # Handle @click.command (ast.Attribute)
-            if isinstance(decorator, ast.Attribute):
-                if (isinstance(decorator.value, ast.Name) and 
-                    decorator.value.id == "click" and 
-                    decorator.attr == "command"):
-                    return True
-            # Handle function calls: @click.command() or @command()
-            elif isinstance(decorator, ast.Call):
-                # @click.command() (ast.Call with ast.Attribute func)
-                if (isinstance(decorator.func, ast.Attribute) and
-                    isinstance(decorator.func.value, ast.Name) and
-                    decorator.func.value.id == "click" and
-                    decorator.func.attr == "command"):
-                    return True
-                # @command() (called directly)
-                elif (isinstance(decorator.func, ast.Name) and
-                      decorator.func.id == "command"):
-                    return True
-            # Handle @command (imported directly as name)
-            elif isinstance(decorator, ast.Name):
-                if decorator.id == "command":
-                    return True
+            name = ast.unparse(decorator).split('(', 1)[0]
+            if name in _CLI_DECORATORS:
+                return True
         return False
 
+    def _collect(self) -> _Collector:
+        """Run the single-pass AST collector once and cache its results."""
+        if self._collector is None:
+            collector = _Collector(self)
+            if self.tree:
+                collector.visit(self.tree)
+            self._collector = collector
+        return self._collector
+
     def _extract_entry_points(self) -> List[Dict[str, Any]]:
         """Extract potential entry points."""
-        entry_points = []
-        
-        if not self.tree:
-            return entry_points
-        
-        for node in ast.walk(self.tree):
-            if isinstance(node, ast.FunctionDef):
-                if node.name == "main":
-                    entry_points.append({
-                        "name": "main",
-                        "callable": "main",
-                        "module": None,
-                        "entry_type": "Main"
-                    })
-                elif self._has_click_decorator(node.decorator_list):
-                    entry_points.append({
-                        "name": node.name,
-                        "callable": node.name,
-                        "module": None,
-                        "entry_type": "CliCommand"
-                    })
-        
-        return entry_points
-    
+        return self._collect().entry_points
+
     def _extract_functions(self) -> List[Dict[str, Any]]:
         """Extract function information."""
-        functions = []
-        
-        if not self.tree:
-            return functions
-        
-        for node in ast.walk(self.tree):
-            if isinstance(node, ast.FunctionDef):
-                func_info = {
-                    "name": node.name,
-                    "line_number": node.lineno,
-                    "docstring": ast.get_docstring(node),
-                    "parameters": self._extract_parameters(node),
-                    "returns": self._extract_return_annotation(node),
-                    "decorators": [self._decorator_to_string(d) for d in node.decorator_list],
-                    "is_async": isinstance(node, ast.AsyncFunctionDef)
-                }
-                functions.append(func_info)
-        
-        return functions
-    
+        return self._collect().functions
+
+    def _function_info(self, node) -> Dict[str, Any]:
+        """Build the info dict shared by module functions and class methods."""
+        return {
+            "name": node.name,
+            "line_number": node.lineno,
+            "docstring": ast.get_docstring(node),
+            "parameters": self._extract_parameters(node),
+            "returns": self._extract_return_annotation(node),
+            "decorators": [self._decorator_to_string(d) for d in node.decorator_list],
+            "is_async": isinstance(node, ast.AsyncFunctionDef)
+        }
+
     def _extract_parameters(self, func_node: ast.FunctionDef) -> List[Dict[str, Any]]:
         """Extract function parameters."""
         parameters = []
@@ -288,68 +386,12 @@ class SafeIntrospector:
     
     def _extract_classes(self) -> List[Dict[str, Any]]:
         """Extract class information."""
-        classes = []
-        
-        if not self.tree:
-            return classes
-        
-        for node in ast.walk(self.tree):
-            if isinstance(node, ast.ClassDef):
-                class_info = {
-                    "name": node.name,
-                    "line_number": node.lineno,
-                    "docstring": ast.get_docstring(node),
-                    "methods": [],
-                    "base_classes": [self._node_to_string(base) for base in node.bases]
-                }
-                
-                # Extract methods
-                for item in node.body:
-                    if isinstance(item, ast.FunctionDef):
-                        method_info = {
-                            "name": item.name,
-                            "line_number": item.lineno,
-                            "docstring": ast.get_docstring(item),
-                            "parameters": self._extract_parameters(item),
-                            "returns": self._extract_return_annotation(item),
-                            "decorators": [self._decorator_to_string(d) for d in item.decorator_list],
-                            "is_async": isinstance(item, ast.AsyncFunctionDef)
-                        }
-                        class_info["methods"].append(method_info)
-                
-                classes.append(class_info)
-        
-        return classes
-    
+        return self._collect().classes
+
     def _extract_imports(self) -> List[Dict[str, Any]]:
         """Extract import information."""
-        imports = []
-        
-        if not self.tree:
-            return imports
-        
-        for node in ast.walk(self.tree):
-            if isinstance(node, ast.Import):
-                for alias in node.names:
-                    imports.append({
-                        "module": alias.name,
-                        "names": [],
-                        "alias": alias.asname,
-                        "is_from_import": False,
-                        "line_number": node.lineno
-                    })
-            elif isinstance(node, ast.ImportFrom):
-                names = [alias.name for alias in node.names]
-                imports.append({
-                    "module": node.module or "",
-                    "names": names,
-                    "alias": None,
-                    "is_from_import": True,
-                    "line_number": node.lineno
-                })
-        
-        return imports
-    
+        return self._collect().imports
+
     def _detect_cli_framework(self) -> Optional[Dict[str, Any]]:
         """Detect CLI framework usage."""
         imports = self._extract_imports()
@@ -385,16 +427,7 @@ class SafeIntrospector:
     
     def _node_to_string(self, node) -> str:
         """Convert AST node to string representation."""
-        if isinstance(node, ast.Name):
-            return node.id
-        elif isinstance(node, ast.Constant):
-            return repr(node.value)
-        elif isinstance(node, ast.Attribute):
-            return f"{self._node_to_string(node.value)}.{node.attr}"
-        elif isinstance(node, ast.Subscript):
-            return f"{self._node_to_string(node.value)}[{self._node_to_string(node.slice)}]"
-        else:
-            return ast.unparse(node) if hasattr(ast, 'unparse') else str(node)
+        return ast.unparse(node)
     
     def _decorator_to_string(self, decorator) -> str:
         """Convert decorator to string."""
@@ -429,9 +462,8 @@ class ImportIntrospector(SafeIntrospector):
         pass
 
 
-def calculate_script_hash(script_path: Path) -> str:
+def calculate_script_hash(content: bytes) -> str:
     """Calculate hash of script content."""
-    content = script_path.read_bytes()
     return hashlib.sha256(content).hexdigest()
 
 
@@ -440,12 +472,44 @@ def get_python_version() -> str:
     return f"Python {sys.version}"
 
 
+def serialize_result(result: Union[Dict[str, Any], List[Any]]) -> bytes:
+    """Serialize an introspection result to indented JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(result, option=orjson.OPT_INDENT_2)
+    return json.dumps(result, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def _introspect_one(item) -> Optional[Dict[str, Any]]:
+    """Introspect a single script; also the batch-mode worker function."""
+    script_path_str, mode = item
+    script_path = Path(script_path_str)
+    if not script_path.exists():
+        return None
+
+    # Read once; the bytes feed both the hash and the parser
+    raw = script_path.read_bytes()
+
+    # Choose introspector based on mode
+    if mode == "import":
+        introspector = ImportIntrospector(script_path, raw)
+    else:
+        introspector = SafeIntrospector(script_path, raw)
+
+    return {
+        "schema_version": SCHEMA_VERSION,
+        "python_version": get_python_version(),
+        "script_hash": calculate_script_hash(raw),
+        "metadata": introspector.introspect()
+    }
+
+
 def main():
     parser = argparse.ArgumentParser(description="Pyst Script Introspector")
     parser.add_argument("script_path", type=Path, nargs='?', help="Path to script to introspect")
-    parser.add_argument("--mode", choices=["safe", "import"], default="safe", 
+    parser.add_argument("--mode", choices=["safe", "import"], default="safe",
                        help="Introspection mode")
-    parser.add_argument("--batch", type=str, help="JSON list of script paths for batch processing")
+    parser.add_argument("--batch", type=str,
+                       help="JSON list of script paths for batch processing ('-' reads it from stdin)")
     parser.add_argument("--output", type=Path, help="Output file (default: stdout)")
     
     args = parser.parse_args()
@@ -453,39 +517,32 @@ def main():
     if args.batch:
         # Batch mode: process multiple scripts
         try:
-            script_paths = json.loads(args.batch)
+            batch_json = sys.stdin.read() if args.batch == "-" else args.batch
+            script_paths = json.loads(batch_json)
             if not isinstance(script_paths, list):
                 print("Error: --batch argument must be a JSON list", file=sys.stderr)
                 sys.exit(1)
-            
+
+            # Fan out across cores; introspection is CPU-bound AST work, so
+            # throughput scales with the pool for any nontrivial batch
+            items = [(script_path_str, args.mode) for script_path_str in script_paths]
+            if len(items) > 1:
+                workers = min(len(items), os.cpu_count() or 1)
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    raw_results = list(executor.map(_introspect_one, items))
+            else:
+                raw_results = [_introspect_one(item) for item in items]
+
             results = []
-            for script_path_str in script_paths:
-                script_path = Path(script_path_str)
-                if not script_path.exists():
-                    print(f"Warning: Script not found: {script_path}", file=sys.stderr)
+            for script_path_str, result in zip(script_paths, raw_results):
+                if result is None:
+                    print(f"Warning: Script not found: {script_path_str}", file=sys.stderr)
                     continue
-                
-                # Choose introspector based on mode
-                if args.mode == "import":
-                    introspector = ImportIntrospector(script_path)
-                else:
-                    introspector = SafeIntrospector(script_path)
-                
-                # Perform introspection
-                metadata = introspector.introspect()
-                
-                # Create result for this script
-                result = {
-                    "schema_version": SCHEMA_VERSION,
-                    "python_version": get_python_version(),
-                    "script_hash": calculate_script_hash(script_path),
-                    "metadata": metadata
-                }
                 results.append(result)
-            
+
             # Output all results as JSON array
-            output_json = json.dumps(results, indent=2, ensure_ascii=False)
-            
+            output_bytes = serialize_result(results)
+
         except json.JSONDecodeError as e:
             print(f"Error: Invalid JSON in --batch argument: {e}", file=sys.stderr)
             sys.exit(1)
@@ -503,31 +560,35 @@ def main():
             print(f"Error: Script not found: {args.script_path}", file=sys.stderr)
             sys.exit(1)
         
+        # Read once; the bytes feed both the hash and the parser
+        raw = args.script_path.read_bytes()
+
         # Choose introspector based on mode
         if args.mode == "import":
-            introspector = ImportIntrospector(args.script_path)
+            introspector = ImportIntrospector(args.script_path, raw)
         else:
-            introspector = SafeIntrospector(args.script_path)
-        
+            introspector = SafeIntrospector(args.script_path, raw)
+
         # Perform introspection
         metadata = introspector.introspect()
-        
+
         # Create result
         result = {
             "schema_version": SCHEMA_VERSION,
             "python_version": get_python_version(),
-            "script_hash": calculate_script_hash(args.script_path),
+            "script_hash": calculate_script_hash(raw),
             "metadata": metadata
         }
-        
+
         # Output result
-        output_json = json.dumps(result, indent=2, ensure_ascii=False)
-    
+        output_bytes = serialize_result(result)
+
     # Write output
     if args.output:
-        args.output.write_text(output_json, encoding='utf-8')
+        args.output.write_bytes(output_bytes)
     else:
-        print(output_json)
+        sys.stdout.buffer.write(output_bytes)
+        sys.stdout.buffer.write(b"\n")
 
 
 if __name__ == "__main__":
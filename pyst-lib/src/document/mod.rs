@@ -6,7 +6,7 @@ use serde::{Deserialize, Serialize};
 use std::fs;
 use std::io::{self, Write};
 use std::path::{Path, PathBuf};
-use std::process::Command;
+use std::process::{Command, Stdio};
 
 // Embed the documenter script at compile time
 const DOCUMENTER_SRC: &str = include_str!("../../helpers/documenter.py");
@@ -178,10 +178,22 @@ impl Documenter {
         // Find the documenter.py helper
         let helper_path = self.find_documenter_helper()?;
 
-        // Execute the helper with uv run
-        let output = Command::new("uv")
-            .args(["run", &helper_path.to_string_lossy(), &request_json])
-            .output()?;
+        // Execute the helper with uv run, piping the request over stdin to
+        // avoid ARG_MAX limits on large script contents
+        let mut child = Command::new("uv")
+            .args(["run", &helper_path.to_string_lossy(), "-"])
+            .stdin(Stdio::piped())
+            .stdout(Stdio::piped())
+            .stderr(Stdio::piped())
+            .spawn()?;
+
+        child
+            .stdin
+            .take()
+            .ok_or_else(|| anyhow!("Failed to open documenter stdin"))?
+            .write_all(request_json.as_bytes())?;
+
+        let output = child.wait_with_output()?;
 
         if !output.status.success() {
             let stderr = String::from_utf8_lossy(&output.stderr);
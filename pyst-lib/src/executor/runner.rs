@@ -71,6 +71,10 @@ impl Executor {
             cmd.current_dir(&cwd);
         }
 
+        // Unbuffered Python stdout/stderr so script output streams in real
+        // time without scripts needing print(..., flush=True)
+        cmd.env("PYTHONUNBUFFERED", "1");
+
         // Apply offline mode
         if self.is_offline_mode() {
             cmd.env("UV_NO_NETWORK", "1");
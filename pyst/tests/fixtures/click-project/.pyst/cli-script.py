@@ -1,32 +1,78 @@
-#!/usr/bin/env python3
+#!/usr/bin/env -S python3 -u
 """Test CLI framework argument forwarding in containers."""
 # /// script
-# requires-python = ">=3.8"
-# dependencies = ["click>=8.0.0"]
+# requires-python = ">=3.11,<3.13"
 # ///
 
-import click
 import sys
 
-@click.command()
-@click.option('--name', '-n', default='Container', help='Name to greet')
-@click.option('--count', '-c', default=1, type=int, help='Number of greetings')
-@click.option('--verbose', '-v', is_flag=True, help='Verbose output')
-@click.argument('extra_args', nargs=-1)
-def main(name, count, verbose, extra_args):
-    """Test script for Click argument forwarding in containers."""
-    
+def _usage_error(message):
+    """Mimic a real CLI parser: one-line error on stderr, exit code 2."""
+    print(f"usage: cli-script.py [-n NAME] [-c COUNT] [-v] [EXTRA_ARGS...] ({message})",
+          file=sys.stderr)
+    sys.exit(2)
+
+def _to_count(value):
+    """Convert a count argument, or exit with a usage error."""
+    try:
+        return int(value)
+    except ValueError:
+        _usage_error(f"invalid count: {value!r}")
+
+def parse(argv):
+    """Single linear scan over argv; three known options need no framework."""
+    name, count, verbose = 'Container', 1, False
+    extra_args = []
+    i = 1
+    while i < len(argv):
+        a = argv[i]
+        if a in ('-n', '--name'):
+            if i + 1 == len(argv):
+                _usage_error(f"option {a} requires a value")
+            name = argv[i + 1]
+            i += 2
+        elif a.startswith('--name='):
+            name = a[7:]
+            i += 1
+        elif a in ('-c', '--count'):
+            if i + 1 == len(argv):
+                _usage_error(f"option {a} requires a value")
+            count = _to_count(argv[i + 1])
+            i += 2
+        elif a.startswith('--count='):
+            count = _to_count(a[8:])
+            i += 1
+        elif a in ('-v', '--verbose'):
+            verbose = True
+            i += 1
+        else:
+            # First non-option token: the rest is forwarded extra args
+            extra_args = argv[i:]
+            break
+    return name, count, verbose, extra_args
+
+def main():
+    """Test script for CLI argument forwarding in containers."""
+    name, count, verbose, extra_args = parse(sys.argv)
+
     if verbose:
-        print("Container verbose mode enabled")
-        print(f"Container raw sys.argv: {sys.argv}")
-    
-    for i in range(count):
-        print(f"Container hello, {name}! (greeting {i + 1})")
-    
+        # writelines lets the stream coalesce both lines into one write and
+        # keeps the constant text out of any format-string pass
+        sys.stdout.writelines([
+            "Container verbose mode enabled\n",
+            "Container raw sys.argv: ", repr(sys.argv), "\n",
+        ])
+
+    # One write for all greetings instead of count print()/write() pairs
+    sys.stdout.write("".join(
+        [f"Container hello, {name}! (greeting {i + 1})\n" for i in range(count)]
+    ))
+
     if extra_args:
-        print(f"Container extra arguments: {list(extra_args)}")
-    
+        # parse() already yields a list, so its repr matches with no copy
+        print(f"Container extra arguments: {extra_args}")
+
     print("Container Click test completed")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
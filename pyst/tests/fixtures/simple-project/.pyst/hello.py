@@ -1,27 +1,34 @@
-#!/usr/bin/env python3
+#!/usr/bin/env -S python3 -u
 """Simple hello script for container testing."""
 # /// script
-# requires-python = ">=3.8"
+# requires-python = ">=3.11,<3.13"
 # ///
 
+import os
 import sys
 import time
 
-def main():
-    print("Hello from containerized pyst!", flush=True)
-    print("This is stdout output", flush=True)
-    print("Error message", file=sys.stderr, flush=True)
-    
-    # Test arguments
-    if len(sys.argv) > 1:
-        print(f"Arguments received: {sys.argv[1:]}", flush=True)
-    
-    # Test streaming with delay
-    for i in range(3):
-        print(f"Streaming line {i + 1}", flush=True)
-        time.sleep(0.1)
-    
-    print("Container test completed!")
+# The streaming payload is fixed at three lines; precomputed so the loop
+# skips per-iteration f-string formatting
+STREAM_LINES = ("Streaming line 1\n", "Streaming line 2\n", "Streaming line 3\n")
 
-if __name__ == "__main__":
-    main()
\ No newline at end of file
+# This fixture is only ever executed, never imported, so the body runs at
+# module scope without a main() call frame
+
+# One write per stream for the static banner; stdout is unbuffered
+# (python3 -u / PYTHONUNBUFFERED=1) so no per-call flushes are needed
+sys.stdout.write("Hello from containerized pyst!\nThis is stdout output\n")
+print("Error message", file=sys.stderr)
+
+# Test arguments
+if len(sys.argv) > 1:
+    print(f"Arguments received: {sys.argv[1:]}")
+
+# Test streaming with delay; what matters is three separate writes,
+# not the interval, so keep it short (and overridable)
+interval = float(os.environ.get("PYST_STREAM_INTERVAL", "0.03"))
+for line in STREAM_LINES:
+    sys.stdout.write(line)
+    time.sleep(interval)
+
+print("Container test completed!")
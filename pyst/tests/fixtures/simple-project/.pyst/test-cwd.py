@@ -1,21 +1,24 @@
-#!/usr/bin/env python3
+#!/usr/bin/env -S python3 -u
 """Test working directory in containers."""
 # /// script
-# requires-python = ">=3.8"
+# requires-python = ">=3.11,<3.13"
 # ///
 
 import os
-import sys
 
-def main():
-    cwd = os.getcwd()
-    print(f"Container working directory: {cwd}")
-    
-    # Write output file to verify working directory
-    with open("container_cwd_test.txt", "w") as f:
-        f.write(f"Container script ran from: {cwd}\n")
-    
-    print(f"Created test file: {os.path.abspath('container_cwd_test.txt')}")
+# Only ever executed, never imported, so the body runs at module scope
+# without a main() call frame
 
-if __name__ == "__main__":
-    main()
\ No newline at end of file
+cwd = os.getcwd()
+print(f"Container working directory: {cwd}")
+
+# Write output file to verify working directory. A raw fd skips the
+# TextIOWrapper/BufferedWriter stack, which dwarfs this one-line write.
+fd = os.open("container_cwd_test.txt", os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+try:
+    os.write(fd, f"Container script ran from: {cwd}\n".encode("utf-8"))
+finally:
+    os.close(fd)
+
+# abspath would re-run getcwd(); join reuses the value we already have
+print(f"Created test file: {os.path.join(cwd, 'container_cwd_test.txt')}")